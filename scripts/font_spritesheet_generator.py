@@ -6,19 +6,49 @@ Generates sprite sheets from system fonts with character mapping metadata.
 """
 
 import argparse
+import concurrent.futures
+import functools
 import json
-import math
 import os
+import shutil
+import subprocess
 import sys
+import zlib
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    import PIL
+    from PIL import Image, ImageFont
 except ImportError:
     print("Error: Pillow is required. Install with: pip install Pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Optional: vectorizes the UV precompute when available
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: native-code JSON serializer for metadata dumps
+
+try:
+    from fontTools.ttLib import TTFont
+except ImportError:
+    TTFont = None  # Optional: lets the generator skip characters the font can't map
+
+
+def is_simd_pillow() -> bool:
+    """
+    Check whether the installed Pillow is the SIMD-accelerated fork.
+
+    Pillow-SIMD versions carry a ".postN" suffix (e.g. "9.0.0.post1").
+    It is a drop-in replacement, so no other code needs to change.
+    """
+    return '.post' in PIL.__version__
+
 
 # Default character set: A-Z, a-z, 0-9, and common punctuation
 DEFAULT_CHARACTER_SET = (
@@ -31,30 +61,34 @@ DEFAULT_CHARACTER_SET = (
 CELL_SIZE = 16  # Fixed 16x16 cell size
 
 
+@functools.lru_cache(maxsize=None)
 def find_system_font(font_name: str) -> str:
     """
     Find a system font by name. Tries common font locations.
+
+    Memoized: a --sizes run resolves the same name once per process
+    instead of re-statting every candidate path per sheet.
     """
-    # Common font locations on Linux, macOS, and Windows
-    font_paths = [
-        f"/usr/share/fonts/truetype/{font_name.lower()}/{font_name}.ttf",
-        f"/usr/share/fonts/truetype/{font_name.lower()}.ttf",
-        f"/usr/share/fonts/TTF/{font_name}.ttf",
-        f"/System/Library/Fonts/{font_name}.ttf",
-        f"C:\\Windows\\Fonts\\{font_name}.ttf",
-        f"/usr/share/fonts/truetype/dejavu/DejaVu{font_name}.ttf",
-        f"/usr/share/fonts/truetype/liberation/Liberation{font_name}.ttf",
-    ]
-    
-    # Try exact path first
-    if os.path.exists(font_name):
+    # Fast path: the name is already a path to a font file. isfile (rather
+    # than exists) rejects directories, which can't be loaded anyway.
+    if os.path.isfile(font_name):
         return font_name
-    
-    # Try common paths
-    for path in font_paths:
-        if os.path.exists(path):
+
+    # Common font locations on Linux, macOS, and Windows, generated lazily
+    # so the search stops formatting and statting at the first hit
+    def candidates():
+        yield f"/usr/share/fonts/truetype/{font_name.lower()}/{font_name}.ttf"
+        yield f"/usr/share/fonts/truetype/{font_name.lower()}.ttf"
+        yield f"/usr/share/fonts/TTF/{font_name}.ttf"
+        yield f"/System/Library/Fonts/{font_name}.ttf"
+        yield f"C:\\Windows\\Fonts\\{font_name}.ttf"
+        yield f"/usr/share/fonts/truetype/dejavu/DejaVu{font_name}.ttf"
+        yield f"/usr/share/fonts/truetype/liberation/Liberation{font_name}.ttf"
+
+    for path in candidates():
+        if os.path.isfile(path):
             return path
-    
+
     # Fallback to default font
     print(f"Warning: Font '{font_name}' not found. Trying default font.")
     try:
@@ -63,131 +97,341 @@ def find_system_font(font_name: str) -> str:
         raise ValueError(f"Could not find font: {font_name}")
 
 
+@functools.lru_cache(maxsize=None)
+def load_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TTF face at the given size with the basic layout engine.
+
+    Cached so overlapping bisection probes across --sizes runs reuse the
+    parsed face instead of re-reading the font file.
+    """
+    return ImageFont.truetype(font_path, size, layout_engine=ImageFont.Layout.BASIC)
+
+
 def calculate_optimal_font_size(font_path: str, initial_size: int, target_size: int = CELL_SIZE) -> Tuple[ImageFont.FreeTypeFont, int]:
     """
     Calculate the optimal font size that fits within the target cell size.
     Returns the font object and the actual size used.
+
+    Fonts are loaded with the basic layout engine: glyphs are rendered in
+    isolation into fixed cells, so Raqm/HarfBuzz shaping, kerning and
+    ligature lookups are pure overhead. Complex-script fonts that need
+    shaping should switch back to ImageFont.Layout.RAQM here.
+
+    "Fits within the cell" is monotonic in size, so the largest fitting
+    size is found by bisection over [5, initial_size], constructing
+    O(log N) font faces instead of the O(N) linear descent.
     """
     # Leave some padding (2px on each side = 4px total)
     max_fit_size = target_size - 4
-    
-    current_size = initial_size
-    
-    # Try decreasing sizes until we find one that fits
-    for size in range(initial_size, 4, -1):
+
+    if not isinstance(font_path, str):
+        # Default font doesn't support sizing
+        return font_path, 10
+
+    def fits(font: ImageFont.FreeTypeFont) -> bool:
+        # Test with a few characters to check bounds. font.getbbox returns
+        # the same bounds as textbbox without allocating a scratch image or
+        # draw context.
+        test_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789Wm@#"
+
+        max_width = 0
+        max_height = 0
+
+        for char in test_chars[:10]:  # Test first 10 chars for speed
+            bbox = font.getbbox(char)
+            max_width = max(max_width, bbox[2] - bbox[0])
+            max_height = max(max_height, bbox[3] - bbox[1])
+
+        return max_width <= max_fit_size and max_height <= max_fit_size
+
+    # Binary search for the largest size in [5, initial_size] that fits
+    best = None
+    lo, hi = 5, initial_size
+    while lo <= hi:
+        mid = (lo + hi) // 2
         try:
-            if isinstance(font_path, str):
-                font = ImageFont.truetype(font_path, size)
-            else:
-                # Default font doesn't support sizing
-                return font_path, 10
-            
-            # Test with a few characters to check bounds
-            test_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789Wm@#"
-            
-            # Create a test image to measure bounds
-            test_img = Image.new('RGBA', (100, 100), (0, 0, 0, 0))
-            test_draw = ImageDraw.Draw(test_img)
-            
-            max_width = 0
-            max_height = 0
-            
-            for char in test_chars[:10]:  # Test first 10 chars for speed
-                bbox = test_draw.textbbox((0, 0), char, font=font)
-                width = bbox[2] - bbox[0]
-                height = bbox[3] - bbox[1]
-                max_width = max(max_width, width)
-                max_height = max(max_height, height)
-            
-            # Check if it fits
-            if max_width <= max_fit_size and max_height <= max_fit_size:
-                return font, size
-            
+            font = load_font(font_path, mid)
         except Exception as e:
-            print(f"Warning: Could not load font at size {size}: {e}")
-            continue
-    
+            print(f"Warning: Could not load font at size {mid}: {e}")
+            break
+        if fits(font):
+            best = (font, mid)
+            lo = mid + 1
+        else:
+            hi = mid - 1
+
+    if best is not None:
+        return best
+
     # If we get here, use size 8 as absolute minimum
     try:
         if isinstance(font_path, str):
-            return ImageFont.truetype(font_path, 8), 8
+            return load_font(font_path, 8), 8
         else:
             return font_path, 8
     except Exception:
         return ImageFont.load_default(), 8
 
 
+@functools.lru_cache(maxsize=None)
+def font_codepoints(font_path: str) -> Optional["frozenset[int]"]:
+    """
+    Return the codepoints mapped by the font's cmap, or None if unknown.
+
+    Characters outside the cmap would render as tofu (.notdef) after going
+    through the full render path; knowing the cmap up front lets the
+    generator skip them and flag them in the metadata instead. Requires
+    fontTools; returns None (no filtering) when it isn't installed or the
+    table can't be read.
+    """
+    if TTFont is None:
+        return None
+    try:
+        with TTFont(font_path, lazy=True) as ttf:
+            return frozenset(ttf.getBestCmap())
+    except Exception as e:
+        print(f"Warning: Could not read cmap from '{font_path}': {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def render_glyph(font: ImageFont.FreeTypeFont, char: str, mode: str = 'RGBA') -> Image.Image:
+    """
+    Rasterize a single character into a transparent CELL_SIZE x CELL_SIZE tile.
+
+    The FreeType coverage mask (font.getmask2) is pasted directly, skipping
+    ImageDraw.text's per-call ink setup and composite path. The mask offset
+    is computed with anchor='mm' so every glyph keeps the common baseline —
+    all cells are drawn at a uniform y by the engine, so placement must be
+    metric-based, not ink-box-centred. Results are cached per (font, char,
+    mode) so repeated characters and repeated sheets (e.g. --sizes) only
+    pay the rasterization cost once. The font object is already bound to
+    its size, so it serves as the key. In 'L' mode the tile is a grayscale
+    coverage mask (value = alpha).
+    """
+    mask, (offset_x, offset_y) = font.getmask2(char, mode='L', anchor='mm')
+    width, height = mask.size
+
+    if mode == 'L':
+        tile = Image.new('L', (CELL_SIZE, CELL_SIZE), 0)
+        fill = 255
+    else:
+        tile = Image.new('RGBA', (CELL_SIZE, CELL_SIZE), (0, 0, 0, 0))
+        fill = (255, 255, 255, 255)
+
+    if width and height:  # whitespace has no ink
+        # getmask2 returns a raw ImagingCore, which paste can't take as a
+        # mask; rewrap the coverage bytes as a proper L-mode image
+        mask_img = Image.frombytes('L', (width, height), bytes(mask))
+        tile.paste(fill, (CELL_SIZE // 2 + offset_x, CELL_SIZE // 2 + offset_y), mask_img)
+    return tile
+
+
+def optimize_png(image_path: str, level: str) -> None:
+    """
+    Shrink a saved PNG with an external optimizer.
+
+    'fast' runs oxipng, 'max' runs zopflipng. Both beat Pillow's internal
+    encoder on size; the cost is paid once at asset-build time, so the
+    save path itself can stay on a fast compression level. Skipped with a
+    warning when the tool isn't on PATH.
+    """
+    if level == 'none':
+        return
+
+    tool = 'oxipng' if level == 'fast' else 'zopflipng'
+    if shutil.which(tool) is None:
+        print(f"Warning: --optimize {level} requires {tool} on PATH; skipping.")
+        return
+
+    if level == 'fast':
+        subprocess.run(
+            ['oxipng', '-o', '2', '--strip', 'safe', image_path],
+            check=True, capture_output=True
+        )
+    else:
+        tmp_path = image_path + '.tmp'
+        subprocess.run(
+            ['zopflipng', '-y', '--iterations=15', '--filters=0me', image_path, tmp_path],
+            check=True, capture_output=True
+        )
+        os.replace(tmp_path, image_path)
+
+
+# Reusable sheet framebuffer; grows to the largest sheet seen in the process
+_SHEET_BUF = None
+
+
+def _sheet_buffer(shape: Tuple[int, ...]) -> "np.ndarray":
+    """
+    Return a zeroed uint8 framebuffer of the given shape.
+
+    One allocation is kept per process and reused across sheets (a --sizes
+    run renders the same geometry repeatedly), so after the first sheet the
+    clear is a vectorized memset over cache-warm memory instead of a fresh
+    allocation plus page faults.
+    """
+    global _SHEET_BUF
+    size = int(np.prod(shape))
+    if _SHEET_BUF is None or _SHEET_BUF.size < size:
+        _SHEET_BUF = np.zeros(size, dtype=np.uint8)
+    else:
+        _SHEET_BUF[:size] = 0
+    return _SHEET_BUF[:size].reshape(shape)
+
+
 def generate_sprite_sheet(
     font_name: str,
     font_size: int,
     output_dir: str,
     character_set: str = DEFAULT_CHARACTER_SET,
-    columns: int = 10
+    columns: int = 10,
+    png_level: int = 1,
+    mode: str = 'RGBA',
+    optimize: str = 'none',
+    font_path: Optional[str] = None
 ) -> Tuple[str, str]:
     """
     Generate a sprite sheet and metadata JSON for the given font.
-    
+
+    png_level is the zlib compression level (0-9). The default of 1
+    favours encode speed; these sheets are tiny, so the size cost is a
+    few hundred bytes. Use 9 for shipped assets.
+
+    mode selects the pixel format. 'RGBA' (default) matches what the
+    engine's texture loader expects. 'L' stores the glyph coverage as a
+    single grayscale channel — a quarter of the memory traffic through
+    render, filter and deflate — and the metadata gains
+    '"channel": "alpha"' so consumers know to read the value as alpha.
+
+    optimize ('none', 'fast', 'max') selects an external PNG optimizer
+    post-pass for shipped assets; see optimize_png.
+
+    font_path, if given, is the already-resolved path for font_name so
+    multi-size runs resolve the name once instead of once per sheet
+    (font_name is still used for the output filenames).
+
     Returns: (image_path, json_path)
     """
     # Find and load font
-    font_path = find_system_font(font_name)
+    if font_path is None:
+        font_path = find_system_font(font_name)
     font, actual_size = calculate_optimal_font_size(font_path, font_size)
+
+    # Characters outside the font's cmap would render as tofu; skip them in
+    # the render pass and flag them in the metadata instead
+    supported = font_codepoints(font_path) if isinstance(font_path, str) else None
+    if supported is not None:
+        missing = {char for char in character_set if ord(char) not in supported}
+        if missing:
+            shown = ''.join(sorted(missing))
+            print(f"Warning: Font has no glyphs for {len(missing)} character(s): {shown!r}")
+    else:
+        missing = set()
     
     # Calculate grid dimensions
     num_chars = len(character_set)
-    rows = math.ceil(num_chars / columns)
+    rows = (num_chars + columns - 1) // columns  # ceil division, integer-only
     img_width = columns * CELL_SIZE
     img_height = rows * CELL_SIZE
     
-    # Create image with transparency
-    img = Image.new('RGBA', (img_width, img_height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
-    # Character mapping metadata
+    # Render the characters from cached per-character tiles
+    if np is not None:
+        # Blit cached glyph tiles into a NumPy framebuffer. Cells never
+        # overlap, so each blit is a plain slice assignment (a C-level
+        # copy), and the whole sheet becomes one contiguous array handed
+        # back to Pillow in a single Image.fromarray call.
+        shape = (img_height, img_width) if mode == 'L' else (img_height, img_width, 4)
+        buf = _sheet_buffer(shape)
+        for i, char in enumerate(character_set):
+            if char in missing:
+                continue
+            x = (i % columns) * CELL_SIZE
+            y = (i // columns) * CELL_SIZE
+            try:
+                tile = np.asarray(render_glyph(font, char, mode))
+                buf[y:y + CELL_SIZE, x:x + CELL_SIZE] = tile
+            except Exception as e:
+                print(f"Warning: Could not render character '{char}': {e}")
+        img = Image.fromarray(buf, mode)
+    else:
+        background = 0 if mode == 'L' else (0, 0, 0, 0)
+        img = Image.new(mode, (img_width, img_height), background)
+        for i, char in enumerate(character_set):
+            if char in missing:
+                continue
+            x = (i % columns) * CELL_SIZE
+            y = (i // columns) * CELL_SIZE
+            try:
+                tile = render_glyph(font, char, mode)
+                # Cells don't overlap, so the tile copies straight in;
+                # masked pasting would square the coverage at the edges
+                img.paste(tile, (x, y))
+            except Exception as e:
+                print(f"Warning: Could not render character '{char}': {e}")
+
+    # Character mapping metadata. The cell positions and UV coordinates are
+    # pure grid arithmetic, so with NumPy the whole table is computed in a
+    # few C-level array ops instead of ~8 Python float ops per character.
     character_map = {}
+
+    if np is not None:
+        indices = np.arange(num_chars)
+        xs = (indices % columns) * CELL_SIZE
+        ys = (indices // columns) * CELL_SIZE
+        u0s = np.round(xs / img_width, 6)
+        v0s = np.round(ys / img_height, 6)
+        u1s = np.round((xs + CELL_SIZE) / img_width, 6)
+        v1s = np.round((ys + CELL_SIZE) / img_height, 6)
+
+        for i, char in enumerate(character_set):
+            character_map[char] = {
+                "index": i,
+                "x": int(xs[i]),
+                "y": int(ys[i]),
+                "u0": float(u0s[i]),
+                "v0": float(v0s[i]),
+                "u1": float(u1s[i]),
+                "v1": float(v1s[i])
+            }
+            if char in missing:
+                character_map[char]["missing"] = True
+    else:
+        # u0/u1 depend only on the column and v0/v1 only on the row, so the
+        # rounding happens O(columns + rows) times instead of 4x per char
+        u0_by_col = [round(col * CELL_SIZE / img_width, 6) for col in range(columns)]
+        u1_by_col = [round((col + 1) * CELL_SIZE / img_width, 6) for col in range(columns)]
+        v0_by_row = [round(row * CELL_SIZE / img_height, 6) for row in range(rows)]
+        v1_by_row = [round((row + 1) * CELL_SIZE / img_height, 6) for row in range(rows)]
+
+        for i, char in enumerate(character_set):
+            col = i % columns
+            row = i // columns
+
+            # Store metadata
+            character_map[char] = {
+                "index": i,
+                "x": col * CELL_SIZE,
+                "y": row * CELL_SIZE,
+                "u0": u0_by_col[col],
+                "v0": v0_by_row[row],
+                "u1": u1_by_col[col],
+                "v1": v1_by_row[row]
+            }
+            if char in missing:
+                character_map[char]["missing"] = True
     
-    # Render each character
-    for i, char in enumerate(character_set):
-        col = i % columns
-        row = i // columns
-        
-        # Cell position in pixels
-        x = col * CELL_SIZE
-        y = row * CELL_SIZE
-        
-        # Center of the cell
-        center_x = x + CELL_SIZE // 2
-        center_y = y + CELL_SIZE // 2
-        
-        # Draw character centered in cell
-        try:
-            draw.text(
-                (center_x, center_y),
-                char,
-                font=font,
-                fill=(255, 255, 255, 255),  # White with full opacity
-                anchor='mm'  # Middle-middle anchor
-            )
-        except Exception as e:
-            print(f"Warning: Could not render character '{char}': {e}")
-        
-        # Calculate UV coordinates
-        u0 = x / img_width
-        v0 = y / img_height
-        u1 = (x + CELL_SIZE) / img_width
-        v1 = (y + CELL_SIZE) / img_height
-        
-        # Store metadata
-        character_map[char] = {
-            "index": i,
-            "x": x,
-            "y": y,
-            "u0": round(u0, 6),
-            "v0": round(v0, 6),
-            "u1": round(u1, 6),
-            "v1": round(v1, 6)
-        }
-    
+    # ASCII fast path: when the whole character set is ASCII (detected with
+    # one C-level scan via str.isascii), also emit a dense 128-entry table
+    # indexed by codepoint so consumers can replace hash lookups with O(1)
+    # array indexing. Entries for codepoints outside the set stay null.
+    character_table = None
+    if character_set.isascii():
+        character_table = [None] * 128
+        for char, data in character_map.items():
+            character_table[ord(char)] = data
+
     # Create output directory if it doesn't exist
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
@@ -199,8 +443,21 @@ def generate_sprite_sheet(
     image_path = os.path.join(output_dir, image_filename)
     json_path = os.path.join(output_dir, json_filename)
     
-    # Save image
-    img.save(image_path, 'PNG')
+    # Save image (PNG encode dominates the pipeline tail, so keep it cheap).
+    # Pillow's encoder doesn't expose scanline filter selection, so the
+    # available lever is the deflate strategy: the sheet is >90% runs of
+    # transparent zeros, and Z_RLE beats the default match search on both
+    # speed and size here.
+    img.save(
+        image_path,
+        'PNG',
+        compress_level=png_level,
+        compress_type=zlib.Z_RLE,
+        optimize=False
+    )
+
+    # Optional build-time post-pass for shipped assets
+    optimize_png(image_path, optimize)
     
     # Create metadata
     metadata = {
@@ -215,10 +472,20 @@ def generate_sprite_sheet(
         "character_count": num_chars,
         "character_map": character_map
     }
+    if character_table is not None:
+        # Dense codepoint-indexed variant of character_map (ASCII sets only)
+        metadata["character_table"] = character_table
+    if mode == 'L':
+        # Grayscale sheets store coverage only; consumers read it as alpha
+        metadata["channel"] = "alpha"
     
-    # Save metadata JSON
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    # Save metadata JSON (orjson serializes in native code; like
+    # ensure_ascii=False it emits UTF-8 without escaping)
+    if orjson is not None:
+        Path(json_path).write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2, ensure_ascii=False)
     
     return image_path, json_path
 
@@ -262,8 +529,46 @@ def main():
         type=str,
         help='Custom character set (default: A-Z, a-z, 0-9, punctuation)'
     )
-    
+    parser.add_argument(
+        '--png-level',
+        type=int,
+        default=1,
+        choices=range(0, 10),
+        metavar='{0-9}',
+        help='PNG zlib compression level (default: 1 for fast encodes; use 9 for shipped assets)'
+    )
+    parser.add_argument(
+        '--optimize',
+        type=str,
+        default='none',
+        choices=['none', 'fast', 'max'],
+        help='External PNG optimizer post-pass for shipped assets: '
+             'fast runs oxipng, max runs zopflipng (default: none)'
+    )
+    parser.add_argument(
+        '--mode',
+        type=str,
+        default='RGBA',
+        choices=['RGBA', 'L'],
+        help='Sheet pixel format: RGBA (default, matches the engine loader) '
+             'or L (grayscale coverage mask, 4x less memory traffic)'
+    )
+    parser.add_argument(
+        '--require-simd',
+        action='store_true',
+        help='Fail if the installed Pillow is not the SIMD-accelerated build (pillow-simd)'
+    )
+
     args = parser.parse_args()
+
+    # Report which Pillow build is doing the rasterization. Pillow-SIMD is a
+    # drop-in replacement that roughly halves per-glyph draw time.
+    simd_note = 'SIMD build' if is_simd_pillow() else 'standard build'
+    print(f"Pillow version: {PIL.__version__} ({simd_note})")
+    if args.require_simd and not is_simd_pillow():
+        print("Error: --require-simd was given but this is not a pillow-simd build.")
+        print('Install with: pip uninstall Pillow && CC="cc -mavx2" pip install pillow-simd')
+        sys.exit(1)
     
     # Determine which sizes to generate
     sizes = args.sizes if args.sizes else [args.size]
@@ -277,23 +582,85 @@ def main():
     print(f"Output directory: {args.output}")
     print()
     
-    # Generate sprite sheet for each size
+    # Resolve the font once up front: every size shares the same file, and
+    # warming the lookup (and, on fork-based platforms, the face cache)
+    # before the pool spawns means workers inherit it instead of redoing it.
+    # The not-found fallback is an ImageFont object, not a path — it can't
+    # be pickled to workers, so in that case each call re-resolves the name.
+    font_path = find_system_font(args.font)
+    if not isinstance(font_path, str):
+        font_path = None
+
+    # Requested sizes above the cell-fit cap all clamp to the same actual
+    # size and would write the same sheet files — concurrently, in a multi-
+    # size run. Dedupe on the resolved size so each sheet is generated (and
+    # reported) exactly once.
+    probe_path = font_path if font_path is not None else find_system_font(args.font)
+    seen_actual = set()
+    unique_sizes = []
     for size in sizes:
-        try:
-            print(f"Generating sprite sheet for size {size}...")
-            image_path, json_path = generate_sprite_sheet(
-                args.font,
-                size,
-                args.output,
-                character_set,
-                args.columns
-            )
-            print(f"  ✓ Created: {image_path}")
-            print(f"  ✓ Created: {json_path}")
-        except Exception as e:
-            print(f"  ✗ Error generating size {size}: {e}")
-            import traceback
-            traceback.print_exc()
+        _, actual_size = calculate_optimal_font_size(probe_path, size)
+        if actual_size in seen_actual:
+            print(f"Skipping size {size}: clamps to size {actual_size}, already being generated")
+            continue
+        seen_actual.add(actual_size)
+        unique_sizes.append(size)
+    sizes = unique_sizes
+
+    # Generate sprite sheet for each size. Sizes are independent end-to-end
+    # pipelines (font load, render, PNG encode, JSON write), so multi-size
+    # runs fan out across worker processes; a single size stays in-process
+    # to avoid the spawn overhead.
+    if len(sizes) > 1:
+        workers = min(len(sizes), os.cpu_count() or 1)
+        print(f"Generating {len(sizes)} sprite sheets across {workers} processes...")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(
+                    generate_sprite_sheet,
+                    args.font,
+                    size,
+                    args.output,
+                    character_set,
+                    args.columns,
+                    args.png_level,
+                    args.mode,
+                    args.optimize,
+                    font_path
+                ): size
+                for size in sizes
+            }
+            for future in concurrent.futures.as_completed(futures):
+                size = futures[future]
+                try:
+                    image_path, json_path = future.result()
+                    print(f"  ✓ Created: {image_path}")
+                    print(f"  ✓ Created: {json_path}")
+                except Exception as e:
+                    print(f"  ✗ Error generating size {size}: {e}")
+                    import traceback
+                    traceback.print_exc()
+    else:
+        for size in sizes:
+            try:
+                print(f"Generating sprite sheet for size {size}...")
+                image_path, json_path = generate_sprite_sheet(
+                    args.font,
+                    size,
+                    args.output,
+                    character_set,
+                    args.columns,
+                    args.png_level,
+                    args.mode,
+                    args.optimize,
+                    font_path
+                )
+                print(f"  ✓ Created: {image_path}")
+                print(f"  ✓ Created: {json_path}")
+            except Exception as e:
+                print(f"  ✗ Error generating size {size}: {e}")
+                import traceback
+                traceback.print_exc()
     
     print()
     print("Done!")